@@ -30,7 +30,6 @@ class CoinCapDataFeed(DataFeedBase):
     def __init__(self, update_interval: float = 5.0):
         super().__init__()
         self._check_network_interval = 30.0
-        self._ev_loop = asyncio.get_event_loop()
         self._price_dict: Dict[str, float] = {}
         self._update_interval: float = update_interval
         self._fetch_price_task: Optional[asyncio.Task] = None
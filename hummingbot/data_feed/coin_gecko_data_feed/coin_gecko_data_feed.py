@@ -28,7 +28,6 @@ class CoinGeckoDataFeed(DataFeedBase):
 
     def __init__(self, update_interval: float = 30.0):
         super().__init__()
-        self._ev_loop = asyncio.get_event_loop()
         self._price_dict: Dict[str, float] = {}
         self._update_interval = update_interval
         self.fetch_data_loop_task: Optional[asyncio.Task] = None
@@ -1,17 +1,26 @@
 import asyncio
-import aiohttp
 import logging
-from typing import Optional
+import time
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+from yarl import URL
+
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from decimal import Decimal
+from hummingbot.logger import HummingbotLogger
+
+_cadf_shared_client: Optional[aiohttp.ClientSession] = None
+_cadf_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 class CustomAPIDataFeed(NetworkBase):
     cadf_logger: Optional[HummingbotLogger] = None
 
+    TIMEOUTS_BEFORE_WARNING = 3
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls.cadf_logger is None:
@@ -21,13 +30,23 @@ class CustomAPIDataFeed(NetworkBase):
     def __init__(self, api_url, update_interval: float = 5.0):
         super().__init__()
         self._ready_event = asyncio.Event()
-        self._shared_client: Optional[aiohttp.ClientSession] = None
         self._api_url = api_url
+        self._price_url: URL = URL(api_url)
         self._check_network_interval = 30.0
-        self._ev_loop = asyncio.get_event_loop()
         self._price: Decimal = Decimal("0")
         self._update_interval: float = update_interval
+        self._timeout = aiohttp.ClientTimeout(total=update_interval * 4,
+                                              sock_connect=1.0,
+                                              sock_read=update_interval * 2)
         self._fetch_price_task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+        self._last_error_key: Optional[Tuple[type, Optional[int]]] = None
+        self._error_count: int = 0
+        self._timeout_count: int = 0
+        # Monotonic time of the last successful fetch, the price is fresh for one update interval after it
+        self._price_cache_ts: float = float("-inf")
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
 
     @property
     def name(self):
@@ -37,52 +56,136 @@ class CustomAPIDataFeed(NetworkBase):
     def health_check_endpoint(self):
         return self._api_url
 
-    def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+    @classmethod
+    async def _http_client(cls) -> aiohttp.ClientSession:
+        global _cadf_shared_client, _cadf_shared_client_loop
+        # One keep-alive pool for every feed in the process, so polling does not pay a new handshake each time.
+        # The session is bound to the loop that created it, so it is recreated when running on a different loop.
+        loop = asyncio.get_running_loop()
+        if _cadf_shared_client is None or _cadf_shared_client.closed or _cadf_shared_client_loop is not loop:
+            stale_client = _cadf_shared_client
+            connector = aiohttp.TCPConnector(limit=100,
+                                             limit_per_host=20,
+                                             keepalive_timeout=75,
+                                             ttl_dns_cache=300,
+                                             enable_cleanup_closed=True)
+            _cadf_shared_client = aiohttp.ClientSession(connector=connector)
+            _cadf_shared_client_loop = loop
+            if stale_client is not None and not stale_client.closed:
+                # Also closes its connector; aiohttp leaves the transports alone if their loop is already closed
+                await stale_client.close()
+        return _cadf_shared_client
+
+    @property
+    def price_is_fresh(self) -> bool:
+        return time.monotonic() - self._price_cache_ts < self._update_interval
 
     async def check_network(self) -> NetworkStatus:
-        client = self._http_client()
+        if self.price_is_fresh:
+            # The price endpoint answered within the last update interval, no need to hit it again
+            return NetworkStatus.CONNECTED
+        client = await self._http_client()
         async with client.request("GET", self.health_check_endpoint) as resp:
-            status_text = await resp.text()
             if resp.status != 200:
-                raise Exception(f"Custom API Feed {self.name} server error: {status_text}")
+                error_body = await resp.content.read(4096)
+                raise Exception(f"Custom API Feed {self.name} server error: {error_body.decode(errors='replace')}")
         return NetworkStatus.CONNECTED
 
     def get_price(self) -> Decimal:
         return self._price
 
     async def fetch_price_loop(self):
-        while True:
+        next_deadline = time.monotonic()
+        while not self._stop_event.is_set():
             try:
                 await self.fetch_price()
+                if self._last_error_key is not None:
+                    self.logger().info(f"Fetching prices from {self._api_url} recovered after "
+                                       f"{self._error_count} failed attempts.")
+                self._error_count = 0
+                self._timeout_count = 0
+                self._last_error_key = None
             except asyncio.CancelledError:
                 raise
-            except Exception:
-                self.logger().network(f"Error fetching a new price from {self._api_url}.", exc_info=True,
-                                      app_warning_msg="Couldn't fetch newest price from CustomAPI. "
-                                                      "Check network connection.")
-
-            await asyncio.sleep(self._update_interval)
+            except Exception as e:
+                self._report_fetch_error(e)
+
+            # Sleep until the next fixed deadline so the fetch latency does not stretch the polling period
+            next_deadline += self._update_interval
+            now = time.monotonic()
+            if next_deadline < now - self._update_interval:
+                # More than a period behind (e.g. a stalled request), resync instead of bursting catch-up polls
+                next_deadline = now
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=max(0.0, next_deadline - now))
+            except asyncio.TimeoutError:
+                pass
+
+    def _report_fetch_error(self, e: Exception):
+        self._error_count += 1
+        if isinstance(e, asyncio.TimeoutError):
+            # A single slow poll is skipped quietly, only a run of timeouts means the API is unreachable
+            self._timeout_count += 1
+            if self._timeout_count < self.TIMEOUTS_BEFORE_WARNING:
+                self.logger().debug(f"Fetching a new price from {self._api_url} timed out.")
+                return
+            # Connect, read and total timeouts raise different subclasses, they all count as the same failure
+            error_key = (asyncio.TimeoutError, None)
+        else:
+            self._timeout_count = 0
+            # Error pages carry request ids and timestamps, so errors are told apart by type and HTTP status
+            error_key = (type(e), getattr(e, "status", None))
+        # During an outage the same error repeats every poll, only report it when it changes
+        if error_key != self._last_error_key:
+            self._last_error_key = error_key
+            self.logger().network(f"Error fetching a new price from {self._api_url}.", exc_info=e,
+                                  app_warning_msg="Couldn't fetch newest price from CustomAPI. "
+                                                  "Check network connection.")
+
+    def _conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self._etag is not None:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified is not None:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers
 
     async def fetch_price(self):
-        client = self._http_client()
-        async with client.request("GET", self._api_url) as resp:
-            resp_text = await resp.text()
-            if resp.status != 200:
-                raise Exception(f"Custom API Feed {self.name} server error: {resp_text}")
-            self._price = Decimal(str(resp_text))
+        client = await self._http_client()
+        async with client.get(self._price_url, headers=self._conditional_headers(), timeout=self._timeout) as resp:
+            if resp.status != 304:
+                if resp.status != 200:
+                    # Only a prefix of the error page is read; it is enough for the log message
+                    error_body = await resp.content.read(4096)
+                    raise aiohttp.ClientResponseError(
+                        resp.request_info,
+                        resp.history,
+                        status=resp.status,
+                        message=f"Custom API Feed {self.name} server error: {error_body.decode(errors='replace')}",
+                        headers=resp.headers,
+                    )
+                self._price = Decimal((await resp.read()).decode())
+                self._etag = resp.headers.get("ETag")
+                self._last_modified = resp.headers.get("Last-Modified")
+        self._price_cache_ts = time.monotonic()
         self._ready_event.set()
 
     async def start_network(self):
         await self.stop_network()
+        self._stop_event.clear()
         self._fetch_price_task = safe_ensure_future(self.fetch_price_loop())
 
     async def stop_network(self):
         if self._fetch_price_task is not None:
-            self._fetch_price_task.cancel()
-            self._fetch_price_task = None
+            fetch_price_task = self._fetch_price_task
+            # Let the loop finish its current fetch and exit on its own; cancel only if it does not within a period
+            self._stop_event.set()
+            try:
+                await asyncio.wait({fetch_price_task}, timeout=self._update_interval)
+            finally:
+                if not fetch_price_task.done():
+                    fetch_price_task.cancel()
+                self._fetch_price_task = None
 
     def start(self):
         NetworkBase.start(self)
@@ -8,6 +8,9 @@ from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.logger import HummingbotLogger
 
+_dfb_shared_connector: Optional[aiohttp.TCPConnector] = None
+_dfb_shared_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
 
 class DataFeedBase(NetworkBase):
     dfb_logger: Optional[HummingbotLogger] = None
@@ -42,9 +45,31 @@ class DataFeedBase(NetworkBase):
     def get_price(self, asset: str) -> float:
         raise NotImplementedError
 
+    @classmethod
+    async def _shared_connector(cls) -> aiohttp.TCPConnector:
+        global _dfb_shared_connector, _dfb_shared_connector_loop
+        # Sessions stay per feed, but all of them draw from one bounded connection pool.
+        # The pool is bound to the loop that created it, so it is recreated when running on a different loop.
+        loop = asyncio.get_running_loop()
+        if _dfb_shared_connector is None or _dfb_shared_connector.closed or _dfb_shared_connector_loop is not loop:
+            stale_connector = _dfb_shared_connector
+            _dfb_shared_connector = aiohttp.TCPConnector(limit=200,
+                                                         limit_per_host=32,
+                                                         keepalive_timeout=75)
+            _dfb_shared_connector_loop = loop
+            if stale_connector is not None and not stale_connector.closed:
+                # aiohttp leaves the pooled transports alone if their loop is already closed
+                await stale_connector.close()
+        return _dfb_shared_connector
+
     async def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+        connector = await self._shared_connector()
+        if self._shared_client is None or self._shared_client.closed or self._shared_client.connector is not connector:
+            stale_client = self._shared_client
+            self._shared_client = aiohttp.ClientSession(connector=connector, connector_owner=False)
+            if stale_client is not None and not stale_client.closed:
+                # The session does not own the pool, closing it only detaches it from the stale connector
+                await stale_client.close()
         return self._shared_client
 
     async def get_ready(self):
@@ -65,7 +90,8 @@ class DataFeedBase(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            async with aiohttp.ClientSession() as session:
+            connector = await self._shared_connector()
+            async with aiohttp.ClientSession(connector=connector, connector_owner=False) as session:
                 async with session.get(self.health_check_endpoint) as resp:
                     status_text = await resp.text()
                     if resp.status != 200:
@@ -0,0 +1,239 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+from aioresponses import aioresponses
+from aioresponses.core import CallbackResult
+from yarl import URL
+
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.data_feed.custom_api_data_feed import CustomAPIDataFeed
+
+
+class CustomAPIDataFeedTest(unittest.TestCase):
+    # the level is required to receive logs from the data source logger
+    level = 0
+
+    api_url = "https://test.api/price"
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.data_feed = CustomAPIDataFeed(api_url=self.api_url, update_interval=0.05)
+
+        self.log_records = []
+        self.data_feed.logger().setLevel(1)
+        self.data_feed.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.data_feed.stop_network())
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def is_logged(self, log_level: str, message: str) -> bool:
+        return any(
+            record.levelname == log_level and record.getMessage() == message for
+            record in self.log_records)
+
+    def count_logs(self, log_level: str) -> int:
+        return sum(1 for record in self.log_records if record.levelname == log_level)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def sent_requests(self, mock_api: aioresponses):
+        return mock_api.requests.get(("GET", URL(self.api_url)), [])
+
+    def sent_headers(self, mock_api: aioresponses):
+        return [request.kwargs["headers"] for request in self.sent_requests(mock_api)]
+
+    @aioresponses()
+    def test_fetch_price(self, mock_api: aioresponses):
+        mock_api.get(url=self.api_url, body="123.45")
+
+        self.async_run_with_timeout(self.data_feed.fetch_price())
+
+        self.assertEqual(Decimal("123.45"), self.data_feed.get_price())
+        self.assertTrue(self.data_feed._ready_event.is_set())
+        self.assertEqual([{}], self.sent_headers(mock_api))
+        self.assertEqual(self.data_feed._timeout, self.sent_requests(mock_api)[0].kwargs["timeout"])
+
+    @aioresponses()
+    def test_fetch_price_sends_conditional_headers_and_keeps_price_when_not_modified(self, mock_api: aioresponses):
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        mock_api.get(url=self.api_url, body="123.45", headers={"ETag": '"v1"', "Last-Modified": last_modified})
+        mock_api.get(url=self.api_url, status=304)
+
+        self.async_run_with_timeout(self.data_feed.fetch_price())
+        self.async_run_with_timeout(self.data_feed.fetch_price())
+
+        self.assertEqual(Decimal("123.45"), self.data_feed.get_price())
+        self.assertEqual({"If-None-Match": '"v1"', "If-Modified-Since": last_modified},
+                         self.sent_headers(mock_api)[1])
+
+    @aioresponses()
+    def test_fetch_price_raises_on_server_error_with_capped_body(self, mock_api: aioresponses):
+        error_page = "Bad gateway" + "." * 8192
+        mock_api.get(url=self.api_url, status=502, body=error_page)
+
+        with self.assertRaises(aiohttp.ClientResponseError) as error:
+            self.async_run_with_timeout(self.data_feed.fetch_price())
+
+        self.assertEqual(502, error.exception.status)
+        self.assertEqual(f"Custom API Feed custom_api server error: {error_page[:4096]}", error.exception.message)
+        self.assertEqual(Decimal("0"), self.data_feed.get_price())
+        self.assertFalse(self.data_feed._ready_event.is_set())
+
+    @aioresponses()
+    def test_check_network_requests_endpoint_before_first_price(self, mock_api: aioresponses):
+        mock_api.get(url=self.api_url, body="123.45")
+
+        self.assertFalse(self.data_feed.price_is_fresh)
+        status = self.async_run_with_timeout(self.data_feed.check_network())
+
+        self.assertEqual(NetworkStatus.CONNECTED, status)
+        self.assertEqual(1, len(self.sent_requests(mock_api)))
+
+    @aioresponses()
+    def test_check_network_skips_request_while_price_is_fresh(self, mock_api: aioresponses):
+        mock_api.get(url=self.api_url, body="123.45")
+
+        self.async_run_with_timeout(self.data_feed.fetch_price())
+        self.assertTrue(self.data_feed.price_is_fresh)
+        status = self.async_run_with_timeout(self.data_feed.check_network())
+
+        self.assertEqual(NetworkStatus.CONNECTED, status)
+        self.assertEqual(1, len(self.sent_requests(mock_api)))
+
+    @patch("hummingbot.data_feed.custom_api_data_feed.asyncio.wait_for", new_callable=AsyncMock)
+    @patch("hummingbot.data_feed.custom_api_data_feed.time")
+    @patch("hummingbot.data_feed.custom_api_data_feed.CustomAPIDataFeed.fetch_price", new_callable=AsyncMock)
+    def test_fetch_price_loop_polls_on_fixed_deadlines(self, fetch_price_mock: AsyncMock, time_mock: MagicMock,
+                                                       wait_for_mock: AsyncMock):
+        data_feed = CustomAPIDataFeed(api_url=self.api_url, update_interval=10.0)
+        clock = 100.0
+        fetch_times = []
+        # the second fetch runs late but within a period, the third one stalls for more than a period
+        fetch_latencies = iter([2.0, 15.0, 35.0, 1.0])
+
+        async def fetch_price():
+            nonlocal clock
+            fetch_times.append(clock)
+            clock += next(fetch_latencies)
+            if len(fetch_times) == 4:
+                data_feed._stop_event.set()
+
+        async def wait_for_stop_event(stop_event_wait: Awaitable, timeout: float):
+            nonlocal clock
+            stop_event_wait.close()
+            clock += timeout
+            raise asyncio.TimeoutError
+
+        time_mock.monotonic.side_effect = lambda: clock
+        fetch_price_mock.side_effect = fetch_price
+        wait_for_mock.side_effect = wait_for_stop_event
+
+        # asyncio.wait_for is patched, so the loop is run without the timeout helper
+        asyncio.get_event_loop().run_until_complete(data_feed.fetch_price_loop())
+
+        self.assertEqual([100.0, 110.0, 125.0, 160.0], fetch_times)
+        self.assertEqual([8.0, 0.0, 0.0, 9.0], [call.kwargs["timeout"] for call in wait_for_mock.call_args_list])
+
+    def test_timeouts_are_reported_after_consecutive_failures(self):
+        for _ in range(CustomAPIDataFeed.TIMEOUTS_BEFORE_WARNING - 1):
+            self.data_feed._report_fetch_error(asyncio.TimeoutError())
+
+        self.assertEqual(0, self.count_logs("NETWORK"))
+        self.assertEqual(CustomAPIDataFeed.TIMEOUTS_BEFORE_WARNING - 1, self.count_logs("DEBUG"))
+
+        self.data_feed._report_fetch_error(aiohttp.ServerTimeoutError())
+        self.data_feed._report_fetch_error(asyncio.TimeoutError())
+
+        self.assertEqual(1, self.count_logs("NETWORK"))
+        network_log = next(record for record in self.log_records if record.levelname == "NETWORK")
+        self.assertIsInstance(network_log.exc_info[1], aiohttp.ServerTimeoutError)
+        self.assertEqual(CustomAPIDataFeed.TIMEOUTS_BEFORE_WARNING + 1, self.data_feed._error_count)
+
+    @aioresponses()
+    def test_fetch_price_loop_logs_repeated_error_once_and_recovery(self, mock_api: aioresponses):
+        requests_count = 0
+        recovered_event = asyncio.Event()
+
+        def error_page(*_, **__):
+            nonlocal requests_count
+            requests_count += 1
+            # error pages differ on every request, e.g. they carry a request id
+            return CallbackResult(status=502, body=f"Bad gateway, request id {requests_count}")
+
+        mock_api.get(url=self.api_url, callback=error_page)
+        mock_api.get(url=self.api_url, callback=error_page)
+        mock_api.get(url=self.api_url, callback=error_page)
+        mock_api.get(url=self.api_url, body="123.45", callback=lambda *_, **__: recovered_event.set())
+
+        self.async_run_with_timeout(self.data_feed.start_network())
+        self.async_run_with_timeout(recovered_event.wait())
+        self.async_run_with_timeout(self.data_feed.stop_network())
+
+        self.assertEqual(3, requests_count)
+        self.assertEqual(1, self.count_logs("NETWORK"))
+        self.assertTrue(self.is_logged("NETWORK", f"Error fetching a new price from {self.api_url}."))
+        self.assertTrue(self.is_logged("INFO", f"Fetching prices from {self.api_url} recovered after 3 failed attempts."))
+        self.assertEqual(Decimal("123.45"), self.data_feed.get_price())
+
+    @aioresponses()
+    def test_stop_network_lets_fetch_loop_exit(self, mock_api: aioresponses):
+        price_requested_event = asyncio.Event()
+        mock_api.get(url=self.api_url, body="123.45", callback=lambda *_, **__: price_requested_event.set(),
+                     repeat=True)
+
+        self.async_run_with_timeout(self.data_feed.start_network())
+        self.async_run_with_timeout(price_requested_event.wait())
+        fetch_price_task = self.data_feed._fetch_price_task
+        self.async_run_with_timeout(self.data_feed.stop_network())
+
+        self.assertIsNone(self.data_feed._fetch_price_task)
+        self.assertTrue(fetch_price_task.done())
+        self.assertFalse(fetch_price_task.cancelled())
+
+    @patch("hummingbot.data_feed.custom_api_data_feed.CustomAPIDataFeed.fetch_price", new_callable=AsyncMock)
+    def test_cancelled_stop_network_keeps_feed_restartable(self, fetch_price_mock: AsyncMock):
+        async def fetch_price_never_returns():
+            await asyncio.Event().wait()
+
+        fetch_price_mock.side_effect = fetch_price_never_returns
+
+        async def cancel_stop_network():
+            await self.data_feed.start_network()
+            await asyncio.sleep(0)
+            stop_task = asyncio.ensure_future(self.data_feed.stop_network())
+            await asyncio.sleep(0)
+            stop_task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await stop_task
+
+        self.async_run_with_timeout(cancel_stop_network())
+
+        self.assertIsNone(self.data_feed._fetch_price_task)
+        self.async_run_with_timeout(self.data_feed.start_network())
+        self.assertIsNotNone(self.data_feed._fetch_price_task)
+
+    def test_http_client_is_shared_and_recreated_for_a_new_event_loop(self):
+        other_data_feed = CustomAPIDataFeed(api_url="https://other.api/price")
+
+        client = self.async_run_with_timeout(self.data_feed._http_client())
+        self.assertIs(client, self.async_run_with_timeout(other_data_feed._http_client()))
+
+        new_loop = asyncio.new_event_loop()
+        try:
+            new_client = new_loop.run_until_complete(self.data_feed._http_client())
+            self.assertIsNot(client, new_client)
+            self.assertTrue(client.closed)
+            new_loop.run_until_complete(new_client.close())
+        finally:
+            new_loop.close()
@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+from aioresponses import aioresponses
+
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.data_feed.data_feed_base import DataFeedBase
+
+
+class MockDataFeed(DataFeedBase):
+    @property
+    def name(self):
+        return "mock_data_feed"
+
+    @property
+    def health_check_endpoint(self) -> str:
+        return "https://test.api/ping"
+
+
+class DataFeedBaseTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_feed = MockDataFeed()
+
+    def tearDown(self) -> None:
+        if self.data_feed._shared_client is not None:
+            self.async_run_with_timeout(self.data_feed._shared_client.close())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_http_client_is_reused_and_shares_the_connector_across_feeds(self):
+        other_data_feed = MockDataFeed()
+
+        client = self.async_run_with_timeout(self.data_feed._http_client())
+        other_client = self.async_run_with_timeout(other_data_feed._http_client())
+
+        self.assertIs(client, self.async_run_with_timeout(self.data_feed._http_client()))
+        self.assertIsNot(client, other_client)
+        self.assertIs(client.connector, other_client.connector)
+        self.assertIs(client.connector, self.async_run_with_timeout(DataFeedBase._shared_connector()))
+        self.async_run_with_timeout(other_client.close())
+
+    def test_http_client_and_connector_are_recreated_for_a_new_event_loop(self):
+        client = self.async_run_with_timeout(self.data_feed._http_client())
+        connector = client.connector
+
+        new_loop = asyncio.new_event_loop()
+        try:
+            new_client = new_loop.run_until_complete(self.data_feed._http_client())
+            self.assertIsNot(client, new_client)
+            self.assertIsNot(connector, new_client.connector)
+            self.assertTrue(connector.closed)
+            self.assertTrue(client.closed)
+            new_loop.run_until_complete(new_client.connector.close())
+        finally:
+            new_loop.close()
+
+    @aioresponses()
+    def test_check_network_leaves_the_shared_connector_open(self, mock_api: aioresponses):
+        mock_api.get(url=self.data_feed.health_check_endpoint, body="pong")
+        connector = self.async_run_with_timeout(DataFeedBase._shared_connector())
+
+        status = self.async_run_with_timeout(self.data_feed.check_network())
+
+        self.assertEqual(NetworkStatus.CONNECTED, status)
+        self.assertFalse(connector.closed)
+        self.assertIs(connector, self.async_run_with_timeout(DataFeedBase._shared_connector()))
+
+    @aioresponses()
+    def test_check_network_reports_server_error(self, mock_api: aioresponses):
+        mock_api.get(url=self.data_feed.health_check_endpoint, status=503, body="Service unavailable")
+
+        status = self.async_run_with_timeout(self.data_feed.check_network())
+
+        self.assertEqual(NetworkStatus.NOT_CONNECTED, status)